@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
+import itertools
 import logging
 import time
+from collections import defaultdict
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, cast
 
 from typing_extensions import Literal
@@ -17,6 +20,7 @@ from chia.types.spend_bundle import SpendBundle
 from chia.util.db_wrapper import DBWrapper2
 from chia.util.hash import std_hash
 from chia.util.ints import uint32, uint64
+from chia.util.lru_cache import LRUCache
 from chia.wallet.db_wallet.db_wallet_puzzles import ACS_MU_PH
 from chia.wallet.nft_wallet.nft_wallet import NFTWallet
 from chia.wallet.outer_puzzles import AssetType
@@ -77,6 +81,7 @@ class TradeManager:
     wallet_state_manager: Any
     log: logging.Logger
     trade_store: TradeStore
+    offer_cache: LRUCache[bytes32, Offer]
 
     @staticmethod
     async def create(
@@ -92,8 +97,19 @@ class TradeManager:
 
         self.wallet_state_manager = wallet_state_manager
         self.trade_store = await TradeStore.create(db_wrapper)
+        self.offer_cache = LRUCache(100)
         return self
 
+    def get_offer_for_trade(self, trade: TradeRecord) -> Offer:
+        """
+        Returns the parsed offer of a trade. The trade id is the name of its offer, so cached offers never go stale.
+        """
+        offer = self.offer_cache.get(trade.trade_id)
+        if offer is None:
+            offer = Offer.from_bytes(trade.offer)
+            self.offer_cache.put(trade.trade_id, offer)
+        return offer
+
     async def get_offers_with_status(self, status: TradeStatus) -> List[TradeRecord]:
         records = await self.trade_store.get_trade_record_with_status(status)
         return records
@@ -111,13 +127,7 @@ class TradeManager:
         return coin_ids
 
     async def get_trade_by_coin(self, coin: Coin) -> Optional[TradeRecord]:
-        all_trades = await self.get_all_trades()
-        for trade in all_trades:
-            if trade.status == TradeStatus.CANCELLED.value:
-                continue
-            if coin in trade.coins_of_interest:
-                return trade
-        return None
+        return await self.trade_store.get_trade_record_by_coin_id(coin.name())
 
     async def coins_of_interest_farmed(
         self, coin_state: CoinState, fork_height: Optional[uint32], peer: WSChiaConnection
@@ -136,16 +146,14 @@ class TradeManager:
         if coin_state.spent_height is None:
             self.log.error(f"Coin: {coin_state.coin}, has not been spent so trade can remain valid")
         # Then let's filter the offer into coins that WE offered
-        offer = Offer.from_bytes(trade.offer)
+        offer = self.get_offer_for_trade(trade)
         primary_coin_ids = [c.name() for c in offer.removals()]
         # TODO: Add `WalletCoinStore.get_coins`.
         result = await self.wallet_state_manager.coin_store.get_coin_records(
             coin_id_filter=HashFilter.include(primary_coin_ids)
         )
-        our_primary_coins: List[Coin] = [cr.coin for cr in result.records]
-        our_additions: List[Coin] = list(
-            filter(lambda c: offer.get_root_removal(c) in our_primary_coins, offer.additions())
-        )
+        our_primary_coins: Set[Coin] = {cr.coin for cr in result.records}
+        our_additions: List[Coin] = [c for c in offer.additions() if offer.get_root_removal(c) in our_primary_coins]
         our_addition_ids: List[bytes32] = [c.name() for c in our_additions]
 
         # And get all relevant coin states
@@ -155,9 +163,9 @@ class TradeManager:
             fork_height=fork_height,
         )
         assert coin_states is not None
-        coin_state_names: List[bytes32] = [cs.coin.name() for cs in coin_states]
+        coin_state_names: Set[bytes32] = {cs.coin.name() for cs in coin_states}
         # If any of our settlement_payments were spent, this offer was a success!
-        if set(our_addition_ids) == set(coin_state_names):
+        if set(our_addition_ids) == coin_state_names:
             height = coin_states[0].created_height
             await self.trade_store.set_status(trade.trade_id, TradeStatus.CONFIRMED, height)
             tx_records: List[TransactionRecord] = await self.calculate_tx_records_for_offer(offer, False)
@@ -178,19 +186,18 @@ class TradeManager:
                 await self.trade_store.set_status(trade.trade_id, TradeStatus.FAILED)
                 self.log.warning(f"Trade with id: {trade.trade_id} failed")
 
-    async def get_locked_coins(self) -> Dict[bytes32, WalletCoinRecord]:
-        """Returns a dictionary of confirmed coins that are locked by a trade."""
-        all_pending = []
-        pending_accept = await self.get_offers_with_status(TradeStatus.PENDING_ACCEPT)
-        pending_confirm = await self.get_offers_with_status(TradeStatus.PENDING_CONFIRM)
-        pending_cancel = await self.get_offers_with_status(TradeStatus.PENDING_CANCEL)
-        all_pending.extend(pending_accept)
-        all_pending.extend(pending_confirm)
-        all_pending.extend(pending_cancel)
+    async def get_locked_coins(self, wallet_id: Optional[uint32] = None) -> Dict[bytes32, WalletCoinRecord]:
+        """
+        Returns a dictionary of confirmed coins that are locked by a trade.
+        If wallet_id is set, only coins of that wallet are returned.
+        """
+        all_pending: List[TradeRecord] = await self.trade_store.get_trade_records_with_statuses(
+            [TradeStatus.PENDING_ACCEPT, TradeStatus.PENDING_CONFIRM, TradeStatus.PENDING_CANCEL]
+        )
 
-        coins_of_interest = []
-        for trade_offer in all_pending:
-            coins_of_interest.extend([c.name() for c in trade_offer.coins_of_interest])
+        coins_of_interest: List[bytes32] = [
+            c.name() for trade_offer in all_pending for c in trade_offer.coins_of_interest
+        ]
 
         # TODO:
         #  - No need to get the coin records here, we are only interested in the coin_id on the call site.
@@ -199,7 +206,7 @@ class TradeManager:
             Dict[bytes32, WalletCoinRecord],
             (
                 await self.wallet_state_manager.coin_store.get_coin_records(
-                    coin_id_filter=HashFilter.include(coins_of_interest)
+                    wallet_id=wallet_id, coin_id_filter=HashFilter.include(coins_of_interest)
                 )
             ).coin_id_to_record,
         )
@@ -228,6 +235,7 @@ class TradeManager:
         all_txs: List[TransactionRecord] = []
         bundles: List[SpendBundle] = []
         fee_to_pay: uint64 = fee
+        now = uint64(int(time.time()))
         for trade_id in trades:
             if trade_id in trade_cache:
                 trade = trade_cache[trade_id]
@@ -247,7 +255,7 @@ class TradeManager:
                 continue
 
             cancellation_additions: List[Coin] = []
-            for coin in Offer.from_bytes(trade.offer).get_cancellation_coins():
+            for coin in self.get_offer_for_trade(trade).get_cancellation_coins():
                 wallet = await self.wallet_state_manager.get_wallet_for_coin(coin.name())
 
                 if wallet is None:
@@ -266,7 +274,7 @@ class TradeManager:
                     else:
                         selected_coins = {coin}
                     tx: TransactionRecord = await wallet.generate_signed_transaction(
-                        uint64(sum([c.amount for c in selected_coins]) - fee_to_pay),
+                        uint64(sum(c.amount for c in selected_coins) - fee_to_pay),
                         new_ph,
                         fee=fee_to_pay,
                         coins=selected_coins,
@@ -291,7 +299,7 @@ class TradeManager:
                 all_txs.append(
                     TransactionRecord(
                         confirmed_at_height=uint32(0),
-                        created_at_time=uint64(int(time.time())),
+                        created_at_time=now,
                         to_puzzle_hash=new_ph,
                         amount=uint64(coin.amount),
                         fee_amount=fee,
@@ -323,7 +331,7 @@ class TradeManager:
         await self.trade_store.add_trade_record(trade, offer_name)
 
         # We want to subscribe to the coin IDs of all coins that are not the ephemeral offer coins
-        offered_coins: Set[Coin] = set([value for values in offer.get_offered_coins().values() for value in values])
+        offered_coins: Set[Coin] = set(itertools.chain.from_iterable(offer.get_offered_coins().values()))
         non_offer_additions: Set[Coin] = set(offer.additions()) ^ offered_coins
         non_offer_removals: Set[Coin] = set(offer.removals()) ^ offered_coins
         await self.wallet_state_manager.add_interested_coin_ids(
@@ -407,7 +415,8 @@ class TradeManager:
                     str(self.wallet_state_manager.wallet_node.logged_in_fingerprint), False
                 )
         try:
-            coins_to_offer: Dict[Union[int, bytes32], List[Coin]] = {}
+            # Coin selection is independent per offered wallet, so it is collected here and run concurrently below
+            coins_to_offer_args: Dict[Union[int, bytes32], Tuple[Any, Optional[bytes32], uint64]] = {}
             requested_payments: Dict[Optional[bytes32], List[Payment]] = {}
             offer_dict_no_ints: Dict[Optional[bytes32], int] = {}
             for id, amount in offer_dict.items():
@@ -456,9 +465,7 @@ class TradeManager:
                     amount_to_select = abs(amount)
                     if wallet.type() == WalletType.STANDARD_WALLET:
                         amount_to_select += fee
-                    coins_to_offer[id] = await wallet.get_coins_to_offer(
-                        asset_id, uint64(amount_to_select), min_coin_amount, max_coin_amount
-                    )
+                    coins_to_offer_args[id] = (wallet, asset_id, uint64(amount_to_select))
                     # Note: if we use check_for_special_offer_making, this is not used.
                 elif amount == 0:
                     raise ValueError("You cannot offer nor request 0 amount of something")
@@ -481,6 +488,16 @@ class TradeManager:
                     else:
                         raise ValueError(f"Wallet for asset id {asset_id} is not properly integrated with TradeManager")
 
+            selected_coins_per_id = await asyncio.gather(
+                *(
+                    wallet.get_coins_to_offer(asset_id, amount_to_select, min_coin_amount, max_coin_amount)
+                    for wallet, asset_id, amount_to_select in coins_to_offer_args.values()
+                )
+            )
+            coins_to_offer: Dict[Union[int, bytes32], List[Coin]] = dict(
+                zip(coins_to_offer_args.keys(), selected_coins_per_id)
+            )
+
             potential_special_offer: Optional[Offer] = await self.check_for_special_offer_making(
                 offer_dict_no_ints, driver_dict, solver, fee, min_coin_amount, max_coin_amount
             )
@@ -488,7 +505,7 @@ class TradeManager:
             if potential_special_offer is not None:
                 return True, potential_special_offer, None
 
-            all_coins: List[Coin] = [c for coins in coins_to_offer.values() for c in coins]
+            all_coins: List[Coin] = list(itertools.chain.from_iterable(coins_to_offer.values()))
             notarized_payments: Dict[Optional[bytes32], List[NotarizedPayment]] = Offer.notarize_payments(
                 requested_payments, all_coins
             )
@@ -500,10 +517,8 @@ class TradeManager:
             # with the XCH side of the offer and don't create an extra fee transaction in other wallets.
             for id in sorted(coins_to_offer.keys()):
                 selected_coins = coins_to_offer[id]
-                if isinstance(id, int):
-                    wallet = self.wallet_state_manager.wallets[id]
-                else:
-                    wallet = await self.wallet_state_manager.get_wallet_for_asset_id(id.hex())
+                # Reuse the wallet resolved while validating the offer instead of looking it up again
+                wallet = coins_to_offer_args[id][0]
                 # This should probably not switch on whether or not we're spending XCH but it has to for now
                 if wallet.type() == WalletType.STANDARD_WALLET:
                     tx = await wallet.generate_signed_transaction(
@@ -565,36 +580,41 @@ class TradeManager:
                 await wsm.create_wallet_for_puzzle_info(offer.driver_dict[key])
 
     async def check_offer_validity(self, offer: Offer, peer: WSChiaConnection) -> bool:
-        all_removals: List[Coin] = offer.removals()
-        all_removal_names: List[bytes32] = [c.name() for c in all_removals]
-        non_ephemeral_removals: List[Coin] = list(
-            filter(lambda c: c.parent_coin_info not in all_removal_names, all_removals)
-        )
-        coin_states = await self.wallet_state_manager.wallet_node.get_coin_state(
-            [c.name() for c in non_ephemeral_removals], peer=peer
+        all_removals: Dict[bytes32, Coin] = {c.name(): c for c in offer.removals()}
+        non_ephemeral_removal_names: List[bytes32] = [
+            name for name, c in all_removals.items() if c.parent_coin_info not in all_removals
+        ]
+        coin_states = await self.wallet_state_manager.wallet_node.get_coin_state(non_ephemeral_removal_names, peer=peer)
+
+        return len(coin_states) == len(non_ephemeral_removal_names) and all(
+            cs.spent_height is None for cs in coin_states
         )
 
-        return len(coin_states) == len(non_ephemeral_removals) and all([cs.spent_height is None for cs in coin_states])
-
     async def calculate_tx_records_for_offer(self, offer: Offer, validate: bool) -> List[TransactionRecord]:
         if validate:
             final_spend_bundle: SpendBundle = offer.to_valid_spend()
         else:
             final_spend_bundle = offer._bundle
 
-        settlement_coins: List[Coin] = [c for coins in offer.get_offered_coins().values() for c in coins]
-        settlement_coin_ids: List[bytes32] = [c.name() for c in settlement_coins]
+        settlement_coin_ids: Set[bytes32] = {
+            c.name() for c in itertools.chain.from_iterable(offer.get_offered_coins().values())
+        }
         additions: List[Coin] = final_spend_bundle.not_ephemeral_additions()
         removals: List[Coin] = final_spend_bundle.removals()
         all_fees = uint64(final_spend_bundle.fees())
+        bundle_name: bytes32 = final_spend_bundle.name()
+        offer_name: bytes32 = offer.name()
+        now = uint64(int(time.time()))
 
         txs = []
 
-        addition_dict: Dict[uint32, List[Coin]] = {}
+        wallet_identifiers = await self.wallet_state_manager.get_wallet_identifiers_for_puzzle_hashes(
+            {c.puzzle_hash for c in additions} | {c.puzzle_hash for c in removals}
+        )
+
+        addition_dict: Dict[uint32, List[Coin]] = defaultdict(list)
         for addition in additions:
-            wallet_identifier = await self.wallet_state_manager.get_wallet_identifier_for_puzzle_hash(
-                addition.puzzle_hash
-            )
+            wallet_identifier = wallet_identifiers.get(addition.puzzle_hash)
             if wallet_identifier is not None:
                 if addition.parent_coin_info in settlement_coin_ids:
                     wallet = self.wallet_state_manager.wallets[wallet_identifier.id]
@@ -602,7 +622,7 @@ class TradeManager:
                     txs.append(
                         TransactionRecord(
                             confirmed_at_height=uint32(0),
-                            created_at_time=uint64(int(time.time())),
+                            created_at_time=now,
                             to_puzzle_hash=to_puzzle_hash,
                             amount=uint64(addition.amount),
                             fee_amount=uint64(0),
@@ -613,27 +633,23 @@ class TradeManager:
                             removals=[],
                             wallet_id=wallet_identifier.id,
                             sent_to=[],
-                            trade_id=offer.name(),
+                            trade_id=offer_name,
                             type=uint32(TransactionType.INCOMING_TRADE.value),
-                            name=std_hash(final_spend_bundle.name() + addition.name()),
+                            name=std_hash(bundle_name + addition.name()),
                             memos=[],
                         )
                     )
                 else:  # This is change
-                    addition_dict.setdefault(wallet_identifier.id, [])
                     addition_dict[wallet_identifier.id].append(addition)
 
         # While we want additions to show up as separate records, removals of the same wallet should show as one
-        removal_dict: Dict[uint32, List[Coin]] = {}
+        removal_dict: Dict[uint32, List[Coin]] = defaultdict(list)
         for removal in removals:
-            wallet_identifier = await self.wallet_state_manager.get_wallet_identifier_for_puzzle_hash(
-                removal.puzzle_hash
-            )
+            wallet_identifier = wallet_identifiers.get(removal.puzzle_hash)
             if wallet_identifier is not None:
-                removal_dict.setdefault(wallet_identifier.id, [])
                 removal_dict[wallet_identifier.id].append(removal)
 
-        all_removals: List[bytes32] = [r.name() for removals in removal_dict.values() for r in removals]
+        all_removals: Set[bytes32] = {r.name() for removals in removal_dict.values() for r in removals}
 
         for wid, grouped_removals in removal_dict.items():
             wallet = self.wallet_state_manager.wallets[wid]
@@ -648,7 +664,7 @@ class TradeManager:
             txs.append(
                 TransactionRecord(
                     confirmed_at_height=uint32(0),
-                    created_at_time=uint64(int(time.time())),
+                    created_at_time=now,
                     to_puzzle_hash=to_puzzle_hash,
                     amount=uint64(sent_amount),
                     fee_amount=all_fees,
@@ -659,9 +675,9 @@ class TradeManager:
                     removals=grouped_removals,
                     wallet_id=wallet.id(),
                     sent_to=[],
-                    trade_id=offer.name(),
+                    trade_id=offer_name,
                     type=uint32(TransactionType.OUTGOING_TRADE.value),
-                    name=std_hash(final_spend_bundle.name() + removal_tree_hash),
+                    name=std_hash(bundle_name + removal_tree_hash),
                     memos=[],
                 )
             )
@@ -723,11 +739,12 @@ class TradeManager:
         await self.maybe_create_wallets_for_offer(complete_offer)
 
         tx_records: List[TransactionRecord] = await self.calculate_tx_records_for_offer(complete_offer, True)
+        now = uint64(int(time.time()))
 
         trade_record: TradeRecord = TradeRecord(
             confirmed_at_index=uint32(0),
-            accepted_at_time=uint64(int(time.time())),
-            created_at_time=uint64(int(time.time())),
+            accepted_at_time=now,
+            created_at_time=now,
             is_my_offer=False,
             sent=uint32(0),
             offer=bytes(complete_offer),
@@ -743,7 +760,7 @@ class TradeManager:
         # Dummy transaction for the sake of the wallet push
         push_tx = TransactionRecord(
             confirmed_at_height=uint32(0),
-            created_at_time=uint64(int(time.time())),
+            created_at_time=now,
             to_puzzle_hash=bytes32([1] * 32),
             amount=uint64(0),
             fee_amount=uint64(0),
@@ -760,8 +777,7 @@ class TradeManager:
             memos=[],
         )
         await self.wallet_state_manager.add_pending_transaction(push_tx)
-        for tx in tx_records:
-            await self.wallet_state_manager.add_transaction(tx)
+        await self.wallet_state_manager.add_transactions(tx_records)
 
         return trade_record, [push_tx, *tx_records]
 
@@ -76,6 +76,8 @@ class Offer:
     # ordered by the coin being spent
     _additions: Dict[Coin, List[Coin]] = field(init=False)
     _offered_coins: Dict[Optional[bytes32], List[Coin]] = field(init=False)
+    # maps the name of every coin spent in the bundle to its non-ephemeral root removal
+    _root_removals: Dict[bytes32, Coin] = field(init=False)
     _final_spend_bundle: Optional[SpendBundle] = field(init=False)
 
     @staticmethod
@@ -242,7 +244,7 @@ class Offer:
         offered_coins: Dict[Optional[bytes32], List[Coin]] = self.get_offered_coins()
         offered_amounts: Dict[Optional[bytes32], int] = {}
         for asset_id, coins in offered_coins.items():
-            offered_amounts[asset_id] = uint64(sum([c.amount for c in coins]))
+            offered_amounts[asset_id] = uint64(sum(c.amount for c in coins))
         return offered_amounts
 
     def get_requested_payments(self) -> Dict[Optional[bytes32], List[NotarizedPayment]]:
@@ -251,7 +253,7 @@ class Offer:
     def get_requested_amounts(self) -> Dict[Optional[bytes32], int]:
         requested_amounts: Dict[Optional[bytes32], int] = {}
         for asset_id, coins in self.get_requested_payments().items():
-            requested_amounts[asset_id] = uint64(sum([c.amount for c in coins]))
+            requested_amounts[asset_id] = uint64(sum(c.amount for c in coins))
         return requested_amounts
 
     def arbitrage(self) -> Dict[Optional[bytes32], int]:
@@ -294,7 +296,7 @@ class Offer:
     def get_pending_amounts(self) -> Dict[str, int]:
         all_additions: List[Coin] = self.additions()
         all_removals: List[Coin] = self.removals()
-        non_ephemeral_removals: List[Coin] = list(filter(lambda c: c not in all_additions, all_removals))
+        non_ephemeral_removals: List[Coin] = [c for c in all_removals if c not in all_additions]
 
         pending_dict: Dict[str, int] = {}
         # First we add up the amounts of all coins that share an ancestor with the offered coins (i.e. a primary coin)
@@ -302,14 +304,15 @@ class Offer:
             name = "xch" if asset_id is None else asset_id.hex()
             pending_dict[name] = 0
             for coin in coins:
-                root_removal: Coin = self.get_root_removal(coin)
+                root_removal_name: bytes32 = self.get_root_removal(coin).name()
 
-                for addition in filter(lambda c: c.parent_coin_info == root_removal.name(), all_additions):
-                    pending_dict[name] += addition.amount
+                for addition in all_additions:
+                    if addition.parent_coin_info == root_removal_name:
+                        pending_dict[name] += addition.amount
 
         # Then we gather anything else as unknown
         sum_of_additions_so_far: int = sum(pending_dict.values())
-        unknown: int = sum([c.amount for c in non_ephemeral_removals]) - sum_of_additions_so_far
+        unknown: int = sum(c.amount for c in non_ephemeral_removals) - sum_of_additions_so_far
         if unknown > 0:
             pending_dict["unknown"] = unknown
 
@@ -318,23 +321,38 @@ class Offer:
     # This method returns all of the coins that are being used in the offer (without which it would be invalid)
     def get_involved_coins(self) -> List[Coin]:
         additions = self.additions()
-        return list(filter(lambda c: c not in additions, self.removals()))
+        return [c for c in self.removals() if c not in additions]
 
     # This returns the non-ephemeral removal that is an ancestor of the specified coin
     # This should maybe move to the SpendBundle object at some point
-    def get_root_removal(self, coin: Coin) -> Coin:
-        all_removals: Set[Coin] = set(self.removals())
-        all_removal_ids: Set[bytes32] = {c.name() for c in all_removals}
-        non_ephemeral_removals: Set[Coin] = {
-            c for c in all_removals if c.parent_coin_info not in {r.name() for r in all_removals}
-        }
-        if coin.name() not in all_removal_ids and coin.parent_coin_info not in all_removal_ids:
-            raise ValueError("The specified coin is not a coin in this bundle")
+    def _get_root_removals(self) -> Dict[bytes32, Coin]:
+        removals_by_name: Dict[bytes32, Coin] = {c.name(): c for c in self.removals()}
+        root_removals: Dict[bytes32, Coin] = {}
+        for name, coin in removals_by_name.items():
+            path: List[bytes32] = []
+            while name not in root_removals and coin.parent_coin_info in removals_by_name:
+                path.append(name)
+                name = coin.parent_coin_info
+                coin = removals_by_name[name]
+            root: Coin = root_removals.get(name, coin)
+            root_removals[name] = root
+            for ephemeral_name in path:
+                root_removals[ephemeral_name] = root
+        return root_removals
 
-        while coin not in non_ephemeral_removals:
-            coin = next(c for c in all_removals if c.name() == coin.parent_coin_info)
+    def get_root_removal(self, coin: Coin) -> Coin:
+        try:
+            root_removals = self._root_removals
+        except AttributeError:
+            root_removals = self._get_root_removals()
+            object.__setattr__(self, "_root_removals", root_removals)
 
-        return coin
+        root: Optional[Coin] = root_removals.get(coin.name())
+        if root is None:
+            root = root_removals.get(coin.parent_coin_info)
+        if root is None:
+            raise ValueError("The specified coin is not a coin in this bundle")
+        return root
 
     # This will only return coins that are ancestors of settlement payments
     def get_primary_coins(self) -> List[Coin]:
@@ -393,11 +411,11 @@ class Offer:
     @classmethod
     def aggregate(cls, offers: List[Offer]) -> Offer:
         total_requested_payments: Dict[Optional[bytes32], List[NotarizedPayment]] = {}
-        total_bundle = SpendBundle([], G2Element())
+        bundles: List[SpendBundle] = []
+        total_inputs: Set[Coin] = set()
         total_driver_dict: Dict[bytes32, PuzzleInfo] = {}
         for offer in offers:
             # First check for any overlap in inputs
-            total_inputs: Set[Coin] = {cs.coin for cs in total_bundle.coin_spends}
             offer_inputs: Set[Coin] = {cs.coin for cs in offer._bundle.coin_spends}
             if total_inputs & offer_inputs:
                 raise ValueError("The aggregated offers overlap inputs")
@@ -413,10 +431,11 @@ class Offer:
                 if key in total_driver_dict and total_driver_dict[key] != value:
                     raise ValueError(f"The offers to aggregate disagree on the drivers for {key.hex()}")
 
-            total_bundle = SpendBundle.aggregate([total_bundle, offer._bundle])
+            bundles.append(offer._bundle)
+            total_inputs |= offer_inputs
             total_driver_dict.update(offer.driver_dict)
 
-        return cls(total_requested_payments, total_bundle, total_driver_dict)
+        return cls(total_requested_payments, SpendBundle.aggregate(bundles), total_driver_dict)
 
     # Validity is defined by having enough funds within the offer to satisfy both sides
     def is_valid(self) -> bool:
@@ -446,16 +465,16 @@ class Offer:
             coin_to_spend_dict: Dict[Coin, CoinSpend] = {}
             coin_to_solution_dict: Dict[Coin, Program] = {}
             for coin in offered_coins:
-                parent_spend: CoinSpend = list(
-                    filter(lambda cs: cs.coin.name() == coin.parent_coin_info, self._bundle.coin_spends)
-                )[0]
+                parent_spend: CoinSpend = next(
+                    cs for cs in self._bundle.coin_spends if cs.coin.name() == coin.parent_coin_info
+                )
                 coin_to_spend_dict[coin] = parent_spend
 
                 inner_solutions = []
                 if coin == offered_coins[0]:
                     nonces: List[bytes32] = [p.nonce for p in all_payments]
                     for nonce in list(dict.fromkeys(nonces)):  # dedup without messing with order
-                        nonce_payments: List[NotarizedPayment] = list(filter(lambda p: p.nonce == nonce, all_payments))
+                        nonce_payments: List[NotarizedPayment] = [p for p in all_payments if p.nonce == nonce]
                         inner_solutions.append((nonce, [np.as_condition_args() for np in nonce_payments]))
                 coin_to_solution_dict[coin] = Program.to(inner_solutions)
 
@@ -527,7 +546,7 @@ class Offer:
             inner_solutions = []
             nonces: List[bytes32] = [p.nonce for p in payments]
             for nonce in list(dict.fromkeys(nonces)):  # dedup without messing with order
-                nonce_payments: List[NotarizedPayment] = list(filter(lambda p: p.nonce == nonce, payments))
+                nonce_payments: List[NotarizedPayment] = [p for p in payments if p.nonce == nonce]
                 inner_solutions.append((nonce, [np.as_condition_args() for np in nonce_payments]))
 
             additional_coin_spends.append(
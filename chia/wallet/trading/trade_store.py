@@ -8,7 +8,7 @@ import aiosqlite
 
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.types.mempool_inclusion_status import MempoolInclusionStatus
-from chia.util.db_wrapper import DBWrapper2
+from chia.util.db_wrapper import DBWrapper2, execute_fetchone
 from chia.util.errors import Err
 from chia.util.ints import uint8, uint32
 from chia.wallet.trade_record import TradeRecord
@@ -115,6 +115,9 @@ class TradeStore:
             await conn.execute(
                 "CREATE INDEX IF NOT EXISTS coin_to_trade_record_index on coin_of_interest_to_trade_record(trade_id)"
             )
+            await conn.execute(
+                "CREATE INDEX IF NOT EXISTS coin_id_to_trade_record_index on coin_of_interest_to_trade_record(coin_id)"
+            )
 
             # coin of interest migration check
             trades_not_emtpy = await (await conn.execute("SELECT trade_id FROM trade_records LIMIT 1")).fetchone()
@@ -315,6 +318,17 @@ class TradeStore:
 
         return records
 
+    async def get_trade_records_with_statuses(self, statuses: List[TradeStatus]) -> List[TradeRecord]:
+        """
+        Returns all TradeRecords matching any of the given statuses in a single query.
+        """
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            rows = await conn.execute_fetchall(
+                "SELECT trade_record from trade_records WHERE status in (%s)" % (",".join("?" * len(statuses)),),
+                [x.value for x in statuses],
+            )
+        return [TradeRecord.from_bytes(row[0]) for row in rows]
+
     async def get_coin_ids_of_interest_with_trade_statuses(self, trade_statuses: List[TradeStatus]) -> Set[bytes32]:
         """
         Checks DB for TradeRecord with id: id and returns it.
@@ -330,6 +344,27 @@ class TradeStore:
             )
         return {bytes32(row[0]) for row in rows}
 
+    async def get_trade_record_by_coin_id(self, coin_id: bytes32) -> Optional[TradeRecord]:
+        """
+        Returns the first pending TradeRecord which has the coin with id: coin_id in its coins of interest.
+        Cancelled, confirmed and failed trades are skipped.
+        """
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            row = await execute_fetchone(
+                conn,
+                "SELECT t.trade_record "
+                "from coin_of_interest_to_trade_record cl, trade_records t "
+                "WHERE "
+                "cl.coin_id=? "
+                "AND LOWER(hex(cl.trade_id)) = t.trade_id "
+                "AND t.status NOT IN (?, ?, ?) "
+                "ORDER BY t.rowid LIMIT 1",
+                (coin_id, TradeStatus.CANCELLED.value, TradeStatus.CONFIRMED.value, TradeStatus.FAILED.value),
+            )
+        if row is None:
+            return None
+        return TradeRecord.from_bytes(row[0])
+
     async def get_not_sent(self) -> List[TradeRecord]:
         """
         Returns the list of trades that have not been received by full node yet.
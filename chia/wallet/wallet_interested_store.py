@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
 from chia.protocols.wallet_protocol import CoinState
 from chia.types.blockchain_format.sized_bytes import bytes32
-from chia.util.db_wrapper import DBWrapper2
+from chia.util.db_wrapper import SQLITE_MAX_VARIABLE_NUMBER, DBWrapper2
 from chia.util.ints import uint32
+from chia.util.misc import to_batches
 
 
 class WalletInterestedStore:
@@ -70,6 +71,19 @@ class WalletInterestedStore:
             return None
         return row[0]
 
+    async def get_interested_puzzle_hash_wallet_ids(self, puzzle_hashes: Set[bytes32]) -> Dict[bytes32, int]:
+        result: Dict[bytes32, int] = {}
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            for batch in to_batches(puzzle_hashes, SQLITE_MAX_VARIABLE_NUMBER):
+                rows = await conn.execute_fetchall(
+                    "SELECT puzzle_hash, wallet_id FROM interested_puzzle_hashes "
+                    f"WHERE puzzle_hash IN ({'?,' * (len(batch.entries) - 1)}?)",
+                    tuple(ph.hex() for ph in batch.entries),
+                )
+                for row in rows:
+                    result[bytes32.fromhex(row[0])] = row[1]
+        return result
+
     async def add_interested_puzzle_hash(self, puzzle_hash: bytes32, wallet_id: int) -> None:
         async with self.db_wrapper.writer_maybe_transaction() as conn:
             cursor = await conn.execute(
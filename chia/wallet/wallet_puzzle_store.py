@@ -7,9 +7,10 @@ from typing import Dict, List, Optional, Set
 from blspy import G1Element
 
 from chia.types.blockchain_format.sized_bytes import bytes32
-from chia.util.db_wrapper import DBWrapper2, execute_fetchone
+from chia.util.db_wrapper import SQLITE_MAX_VARIABLE_NUMBER, DBWrapper2, execute_fetchone
 from chia.util.ints import uint32
 from chia.util.lru_cache import LRUCache
+from chia.util.misc import to_batches
 from chia.wallet.derivation_record import DerivationRecord
 from chia.wallet.util.wallet_types import WalletIdentifier, WalletType
 
@@ -288,6 +289,39 @@ class WalletPuzzleStore:
 
         return None
 
+    async def get_wallet_identifiers_for_puzzle_hashes(
+        self, puzzle_hashes: Set[bytes32]
+    ) -> Dict[bytes32, WalletIdentifier]:
+        """
+        Returns a mapping from puzzle_hash to wallet identifier for the puzzle_hashes we generated.
+        Puzzle hashes which are not present are omitted.
+        """
+        result: Dict[bytes32, WalletIdentifier] = {}
+        to_fetch: Set[bytes32] = set()
+        for puzzle_hash in puzzle_hashes:
+            cached = self.wallet_identifier_cache.get(puzzle_hash)
+            if cached is not None:
+                result[puzzle_hash] = cached
+            else:
+                to_fetch.add(puzzle_hash)
+
+        async with self.db_wrapper.reader_no_transaction() as conn:
+            for batch in to_batches(to_fetch, SQLITE_MAX_VARIABLE_NUMBER):
+                rows = await conn.execute_fetchall(
+                    "SELECT puzzle_hash, wallet_type, wallet_id FROM derivation_paths "
+                    f"WHERE puzzle_hash IN ({'?,' * (len(batch.entries) - 1)}?)",
+                    tuple(ph.hex() for ph in batch.entries),
+                )
+                for row in rows:
+                    puzzle_hash = bytes32.fromhex(row[0])
+                    if puzzle_hash in result:
+                        continue
+                    wallet_identifier = WalletIdentifier(uint32(row[2]), WalletType(row[1]))
+                    self.wallet_identifier_cache.put(puzzle_hash, wallet_identifier)
+                    result[puzzle_hash] = wallet_identifier
+
+        return result
+
     async def get_all_puzzle_hashes(self, wallet_id: Optional[int] = None) -> Set[bytes32]:
         """
         Return a set containing all puzzle_hashes we generated.
@@ -1731,6 +1731,23 @@ class WalletStateManager:
             return WalletIdentifier(uint32(wallet_id), self.wallets[uint32(wallet_id)].type())
         return None
 
+    async def get_wallet_identifiers_for_puzzle_hashes(
+        self, puzzle_hashes: Set[bytes32]
+    ) -> Dict[bytes32, WalletIdentifier]:
+        wallet_identifiers = await self.puzzle_store.get_wallet_identifiers_for_puzzle_hashes(puzzle_hashes)
+        remaining = puzzle_hashes - wallet_identifiers.keys()
+        if len(remaining) == 0:
+            return wallet_identifiers
+
+        interested_wallet_ids = await self.interested_store.get_interested_puzzle_hash_wallet_ids(remaining)
+        for puzzle_hash, interested_wallet_id in interested_wallet_ids.items():
+            wallet_id = uint32(interested_wallet_id)
+            if wallet_id not in self.wallets.keys():
+                self.log.warning(f"Do not have wallet {wallet_id} for puzzle_hash {puzzle_hash}")
+                continue
+            wallet_identifiers[puzzle_hash] = WalletIdentifier(wallet_id, self.wallets[wallet_id].type())
+        return wallet_identifiers
+
     async def coin_added(
         self,
         coin: Coin,
@@ -1826,6 +1843,14 @@ class WalletStateManager:
         await self.tx_store.add_transaction_record(tx_record)
         self.state_changed("pending_transaction", tx_record.wallet_id)
 
+    async def add_transactions(self, tx_records: List[TransactionRecord]) -> None:
+        """
+        Called from wallet to add multiple transactions that are not being set to full_node
+        """
+        await self.tx_store.add_transaction_records(tx_records)
+        for wallet_id in dict.fromkeys(tx.wallet_id for tx in tx_records):
+            self.state_changed("pending_transaction", wallet_id)
+
     async def remove_from_queue(
         self,
         spendbundle_id: bytes32,
@@ -2012,7 +2037,9 @@ class WalletStateManager:
                     removal_dict[coin.name()] = coin
 
         # Coins that are part of the trade
-        offer_locked_coins: Dict[bytes32, WalletCoinRecord] = await self.trade_manager.get_locked_coins()
+        offer_locked_coins: Dict[bytes32, WalletCoinRecord] = await self.trade_manager.get_locked_coins(
+            uint32(wallet_id)
+        )
 
         filtered = set()
         for record in records:
@@ -89,23 +89,32 @@ class WalletTransactionStore:
         """
         Store TransactionRecord in DB and Cache.
         """
+        await self.add_transaction_records([record])
+
+    async def add_transaction_records(self, records: List[TransactionRecord]) -> None:
+        """
+        Store multiple TransactionRecords in DB with a single statement.
+        """
         async with self.db_wrapper.writer_maybe_transaction() as conn:
-            await conn.execute_insert(
+            await conn.executemany(
                 "INSERT OR REPLACE INTO transaction_record VALUES(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-                (
-                    bytes(record),
-                    record.name,
-                    record.confirmed_at_height,
-                    record.created_at_time,
-                    record.to_puzzle_hash.hex(),
-                    bytes(record.amount),
-                    bytes(record.fee_amount),
-                    int(record.confirmed),
-                    record.sent,
-                    record.wallet_id,
-                    record.trade_id,
-                    record.type,
-                ),
+                [
+                    (
+                        bytes(record),
+                        record.name,
+                        record.confirmed_at_height,
+                        record.created_at_time,
+                        record.to_puzzle_hash.hex(),
+                        bytes(record.amount),
+                        bytes(record.fee_amount),
+                        int(record.confirmed),
+                        record.sent,
+                        record.wallet_id,
+                        record.trade_id,
+                        record.type,
+                    )
+                    for record in records
+                ],
             )
 
     async def delete_transaction_record(self, tx_id: bytes32) -> None:
@@ -9,6 +9,7 @@ from blspy import AugSchemeMPL
 
 from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.util.ints import uint32
+from chia.wallet import wallet_puzzle_store
 from chia.wallet.derivation_record import DerivationRecord
 from chia.wallet.util.wallet_types import WalletIdentifier, WalletType
 from chia.wallet.wallet_puzzle_store import WalletPuzzleStore
@@ -129,3 +130,25 @@ async def test_delete_wallet() -> None:
         assert await db.get_last_derivation_path() is None
         assert db.last_derivation_index is None
         assert len(db.last_wallet_derivation_index) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_wallet_identifiers_for_puzzle_hashes(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Use a small batch size so the lookup spans several batches
+    monkeypatch.setattr(wallet_puzzle_store, "SQLITE_MAX_VARIABLE_NUMBER", 7)
+    dummy_records = DummyDerivationRecords()
+    for i in range(3):
+        dummy_records.generate(i, 10)
+    async with DBConnection(1) as wrapper:
+        db = await WalletPuzzleStore.create(wrapper)
+        all_records = [record for records in dummy_records.records_per_wallet.values() for record in records]
+        unknown_puzzle_hash = bytes32(token_bytes(32))
+        puzzle_hashes = {record.puzzle_hash for record in all_records} | {unknown_puzzle_hash}
+        assert await db.get_wallet_identifiers_for_puzzle_hashes(puzzle_hashes) == {}
+        for records in dummy_records.records_per_wallet.values():
+            await db.add_derivation_paths(records)
+        # Populate the cache for one puzzle hash to cover the mix of cached and fetched entries
+        await db.get_wallet_identifier_for_puzzle_hash(all_records[0].puzzle_hash)
+        assert await db.get_wallet_identifiers_for_puzzle_hashes(puzzle_hashes) == {
+            record.puzzle_hash: WalletIdentifier(record.wallet_id, record.wallet_type) for record in all_records
+        }
@@ -51,6 +51,17 @@ async def test_add() -> None:
         assert await store.get_transaction_record(tr1.name) == tr1
 
 
+@pytest.mark.asyncio
+async def test_add_multiple() -> None:
+    async with DBConnection(1) as db_wrapper:
+        store = await WalletTransactionStore.create(db_wrapper)
+
+        tr2 = dataclasses.replace(tr1, name=token_bytes(32), wallet_id=uint32(2))
+        await store.add_transaction_records([tr1, tr2])
+        assert await store.get_transaction_record(tr1.name) == tr1
+        assert await store.get_transaction_record(tr2.name) == tr2
+
+
 @pytest.mark.asyncio
 async def test_delete() -> None:
     async with DBConnection(1) as db_wrapper:
@@ -5,7 +5,9 @@ from secrets import token_bytes
 import pytest
 
 from chia.types.blockchain_format.coin import Coin
+from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.util.ints import uint64
+from chia.wallet import wallet_interested_store
 from chia.wallet.wallet_interested_store import WalletInterestedStore
 from tests.util.db_connection import DBConnection
 
@@ -41,3 +43,18 @@ class TestWalletInterestedStore:
             await store.remove_interested_puzzle_hash(puzzle_hash)
             assert (await store.get_interested_puzzle_hash_wallet_id(puzzle_hash)) is None
             assert len(await store.get_interested_puzzle_hashes()) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_interested_puzzle_hash_wallet_ids(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Use a small batch size so the lookup spans several batches
+        monkeypatch.setattr(wallet_interested_store, "SQLITE_MAX_VARIABLE_NUMBER", 7)
+        async with DBConnection(1) as db_wrapper:
+            store = await WalletInterestedStore.create(db_wrapper)
+            known = {bytes32(token_bytes(32)): i % 5 for i in range(30)}
+            unknown = {bytes32(token_bytes(32)) for _ in range(10)}
+            assert await store.get_interested_puzzle_hash_wallet_ids(set(known) | unknown) == {}
+            for puzzle_hash, wallet_id in known.items():
+                await store.add_interested_puzzle_hash(puzzle_hash, wallet_id)
+            assert await store.get_interested_puzzle_hash_wallet_ids(set(known) | unknown) == known
+            assert await store.get_interested_puzzle_hash_wallet_ids(unknown) == {}
+            assert await store.get_interested_puzzle_hash_wallet_ids(set()) == {}
@@ -10,7 +10,7 @@ from chia.types.blockchain_format.sized_bytes import bytes32
 from chia.util.ints import uint32
 from chia.wallet.derivation_record import DerivationRecord
 from chia.wallet.derive_keys import master_sk_to_wallet_sk, master_sk_to_wallet_sk_unhardened
-from chia.wallet.util.wallet_types import WalletType
+from chia.wallet.util.wallet_types import WalletIdentifier, WalletType
 from chia.wallet.wallet_state_manager import WalletStateManager
 
 
@@ -77,3 +77,39 @@ async def test_get_private_key_failure(simulator_and_wallet: SimulatorsAndWallet
     invalid_puzzle_hash = bytes32(b"1" * 32)
     with pytest.raises(ValueError, match=f"No key for puzzle hash: {invalid_puzzle_hash.hex()}"):
         await wallet_state_manager.get_private_key(bytes32(b"1" * 32))
+
+
+@pytest.mark.asyncio
+async def test_get_wallet_identifiers_for_puzzle_hashes(simulator_and_wallet: SimulatorsAndWallets) -> None:
+    _, [(wallet_node, _)], _ = simulator_and_wallet
+    wallet_state_manager: WalletStateManager = wallet_node.wallet_state_manager
+    derivation_record = DerivationRecord(
+        uint32(10000),
+        bytes32(b"0" * 32),
+        wallet_state_manager.private_key.get_g1(),
+        WalletType.STANDARD_WALLET,
+        uint32(1),
+        False,
+    )
+    await wallet_state_manager.puzzle_store.add_derivation_paths([derivation_record])
+    interested_puzzle_hash = bytes32(b"1" * 32)
+    await wallet_state_manager.interested_store.add_interested_puzzle_hash(interested_puzzle_hash, 1)
+    # Interested puzzle hashes of wallets we don't have are skipped
+    missing_wallet_puzzle_hash = bytes32(b"2" * 32)
+    await wallet_state_manager.interested_store.add_interested_puzzle_hash(missing_wallet_puzzle_hash, 1000)
+    unknown_puzzle_hash = bytes32(b"3" * 32)
+    puzzle_hashes = {
+        derivation_record.puzzle_hash,
+        interested_puzzle_hash,
+        missing_wallet_puzzle_hash,
+        unknown_puzzle_hash,
+    }
+    wallet_identifiers = await wallet_state_manager.get_wallet_identifiers_for_puzzle_hashes(puzzle_hashes)
+    assert wallet_identifiers == {
+        derivation_record.puzzle_hash: WalletIdentifier(uint32(1), WalletType.STANDARD_WALLET),
+        interested_puzzle_hash: WalletIdentifier(uint32(1), WalletType.STANDARD_WALLET),
+    }
+    for puzzle_hash in puzzle_hashes:
+        assert wallet_identifiers.get(puzzle_hash) == (
+            await wallet_state_manager.get_wallet_identifier_for_puzzle_hash(puzzle_hash)
+        )
@@ -105,3 +105,103 @@ async def test_get_coins_of_interest_with_trade_statuses() -> None:
         assert await trade_store.get_coin_ids_of_interest_with_trade_statuses([TradeStatus.PENDING_ACCEPT]) == {
             coin_2.name()
         }
+
+
+@pytest.mark.asyncio
+async def test_get_trade_records_with_statuses() -> None:
+    async with DBConnection(1) as db_wrapper:
+        trade_store = await TradeStore.create(db_wrapper)
+
+        records = []
+        for status in TradeStatus:
+            record = TradeRecord(
+                confirmed_at_index=uint32(0),
+                accepted_at_time=None,
+                created_at_time=uint64(time.time()),
+                is_my_offer=True,
+                sent=uint32(0),
+                offer=bytes([1, 2, 3]),
+                taken_offer=None,
+                coins_of_interest=[],
+                trade_id=bytes32(token_bytes(32)),
+                status=uint32(status.value),
+                sent_to=[],
+            )
+            await trade_store.add_trade_record(record, offer_name=bytes32(token_bytes(32)))
+            records.append(record)
+
+        pending_statuses = [TradeStatus.PENDING_ACCEPT, TradeStatus.PENDING_CONFIRM, TradeStatus.PENDING_CANCEL]
+        result = await trade_store.get_trade_records_with_statuses(pending_statuses)
+        assert {r.trade_id for r in result} == {
+            r.trade_id for r in records if TradeStatus(r.status) in pending_statuses
+        }
+        assert await trade_store.get_trade_records_with_statuses([]) == []
+
+
+@pytest.mark.asyncio
+async def test_get_trade_record_by_coin_id() -> None:
+    async with DBConnection(1) as db_wrapper:
+        trade_store = await TradeStore.create(db_wrapper)
+
+        cancelled = TradeRecord(
+            confirmed_at_index=uint32(0),
+            accepted_at_time=None,
+            created_at_time=uint64(time.time()),
+            is_my_offer=True,
+            sent=uint32(0),
+            offer=bytes([1, 2, 3]),
+            taken_offer=None,
+            coins_of_interest=[coin_1, coin_2],
+            trade_id=bytes32(token_bytes(32)),
+            status=uint32(TradeStatus.CANCELLED.value),
+            sent_to=[],
+        )
+        await trade_store.add_trade_record(cancelled, offer_name=bytes32(token_bytes(32)))
+        pending = TradeRecord(
+            confirmed_at_index=uint32(0),
+            accepted_at_time=None,
+            created_at_time=uint64(time.time()),
+            is_my_offer=True,
+            sent=uint32(0),
+            offer=bytes([1, 2, 3]),
+            taken_offer=None,
+            coins_of_interest=[coin_2],
+            trade_id=bytes32(token_bytes(32)),
+            status=uint32(TradeStatus.PENDING_ACCEPT.value),
+            sent_to=[],
+        )
+        await trade_store.add_trade_record(pending, offer_name=bytes32(token_bytes(32)))
+
+        assert await trade_store.get_trade_record_by_coin_id(coin_1.name()) is None
+        assert await trade_store.get_trade_record_by_coin_id(coin_2.name()) == pending
+        assert await trade_store.get_trade_record_by_coin_id(coin_3.name()) is None
+
+
+@pytest.mark.asyncio
+async def test_get_trade_record_by_coin_id_skips_finished_trades() -> None:
+    async with DBConnection(1) as db_wrapper:
+        trade_store = await TradeStore.create(db_wrapper)
+
+        # Coins of a failed or confirmed trade can end up in a newer offer, which must be the one found
+        records = [
+            TradeRecord(
+                confirmed_at_index=uint32(0),
+                accepted_at_time=None,
+                created_at_time=uint64(time.time()),
+                is_my_offer=True,
+                sent=uint32(0),
+                offer=bytes([1, 2, 3]),
+                taken_offer=None,
+                coins_of_interest=[coin_1],
+                trade_id=bytes32(token_bytes(32)),
+                status=uint32(status.value),
+                sent_to=[],
+            )
+            for status in (TradeStatus.FAILED, TradeStatus.CONFIRMED, TradeStatus.PENDING_CONFIRM)
+        ]
+        for record in records:
+            await trade_store.add_trade_record(record, offer_name=bytes32(token_bytes(32)))
+
+        assert await trade_store.get_trade_record_by_coin_id(coin_1.name()) == records[2]
+        await trade_store.set_status(records[2].trade_id, TradeStatus.FAILED, offer_name=bytes32(token_bytes(32)))
+        assert await trade_store.get_trade_record_by_coin_id(coin_1.name()) is None